@@ -5,7 +5,11 @@
  * Same signing path for USDC, SOL, and USDT (build-transfer-* returns unsigned tx; we sign and submit).
  *
  * Usage:
- *   node fuego_transfer.mjs --to <ADDRESS> --amount <AMOUNT> [--token USDC|SOL|USDT] [--network mainnet-beta] [--server URL]
+ *   node fuego_transfer.mjs --to <ADDRESS> --amount <AMOUNT> [--token USDC|SOL|USDT] [--network mainnet-beta] [--server URL] [--verbose]
+ *   node fuego_transfer.mjs --batch transfers.json [--network mainnet-beta] [--server URL]
+ *
+ * Batch file: JSON array of { "to": "<ADDRESS>", "amount": "<AMOUNT>", "token": "USDC" } (token optional).
+ * Up to 8 transfers are in flight at once, so one transfer's build overlaps another's submit.
  *
  * Wallet is always loaded from ~/.fuego/wallet.json and ~/.fuego/wallet-config.json
  * Environment: FUEGO_SERVER (default http://127.0.0.1:8080), FUEGO_NETWORK (default mainnet-beta).
@@ -14,15 +18,22 @@
 import fs from "fs";
 import path from "path";
 
-import {
-  createKeyPairSignerFromBytes,
-  decompileTransactionMessage,
-  getBase64EncodedWireTransaction,
-  getCompiledTransactionMessageDecoder,
-  getTransactionDecoder,
-  setTransactionMessageFeePayerSigner,
-  signTransactionMessageWithSigners,
-} from "@solana/kit";
+// @solana/kit is imported on first use, so usage errors exit without loading it
+let kitPromise = null;
+
+function loadKit() {
+  if (!kitPromise) kitPromise = import("@solana/kit");
+  return kitPromise;
+}
+
+const TOKENS = ["USDC", "SOL", "USDT"];
+const BATCH_CONCURRENCY = 8;
+// Tracking-id prefix for memos; the pid is fixed for the process so build it once
+const YID_PREFIX = `agent-${process.pid}`;
+// ~/.fuego paths are fixed for the process; resolve them once at load
+const HOME_DIR = process.env.HOME || process.env.USERPROFILE || "~";
+const WALLET_PATH = path.join(HOME_DIR, ".fuego", "wallet.json");
+const WALLET_CONFIG_PATH = path.join(HOME_DIR, ".fuego", "wallet-config.json");
 
 function parseArgs() {
   const args = process.argv.slice(2);
@@ -40,22 +51,30 @@ function parseArgs() {
   return parsed;
 }
 
+// Parsed wallet/config files keyed by absolute path, so wallet.json is read once per process
+const jsonFileCache = new Map();
+
+function readJsonCached(filePath) {
+  if (!jsonFileCache.has(filePath)) {
+    jsonFileCache.set(filePath, JSON.parse(fs.readFileSync(filePath, "utf8")));
+  }
+  return jsonFileCache.get(filePath);
+}
+
 /**
  * Load keypair from JSON wallet (Fuego or Solana CLI format).
  * @returns {Promise<import('@solana/kit').KeyPairSigner>}
  */
 async function loadWalletFromFile(walletPath) {
-  const resolved = path.resolve(
-    walletPath.replace(
-      /^~/,
-      process.env.HOME || process.env.USERPROFILE || "~",
-    ),
-  );
-  if (!fs.existsSync(resolved)) {
-    throw new Error(`Wallet not found at ${resolved}`);
+  const resolved = path.resolve(walletPath.replace(/^~/, HOME_DIR));
+  // Read directly and map ENOENT, rather than stat-ing the file first
+  let data;
+  try {
+    data = readJsonCached(resolved);
+  } catch (e) {
+    if (e.code === "ENOENT") throw new Error(`Wallet not found at ${resolved}`);
+    throw e;
   }
-  const raw = fs.readFileSync(resolved, "utf8");
-  const data = JSON.parse(raw);
 
   let bytes;
   if (Array.isArray(data)) {
@@ -76,37 +95,44 @@ async function loadWalletFromFile(walletPath) {
     );
   }
 
+  const { createKeyPairSignerFromBytes } = await loadKit();
   return createKeyPairSignerFromBytes(bytes);
 }
 
+let cachedWalletAddress = null;
+
 /**
  * Get wallet address from wallet-config.json (same as Python script did).
+ * Resolved once per process and reused.
  * @returns {string} Wallet address
  */
 function getWalletAddress() {
-  const homeDir = process.env.HOME || process.env.USERPROFILE;
-  const configPath = path.join(homeDir, ".fuego", "wallet-config.json");
-
-  if (fs.existsSync(configPath)) {
-    try {
-      const config = JSON.parse(fs.readFileSync(configPath, "utf8"));
-      if (config.publicKey) {
-        return config.publicKey;
-      }
-    } catch (e) {
+  if (cachedWalletAddress) return cachedWalletAddress;
+  cachedWalletAddress = resolveWalletAddress();
+  return cachedWalletAddress;
+}
+
+function resolveWalletAddress() {
+  // Missing files are expected here (ENOENT falls through); only warn on unreadable ones
+  try {
+    const config = readJsonCached(WALLET_CONFIG_PATH);
+    if (config.publicKey) {
+      return config.publicKey;
+    }
+  } catch (e) {
+    if (e.code !== "ENOENT") {
       console.warn("⚠️  Could not read wallet-config.json:", e.message);
     }
   }
 
   // Fallback: derive from wallet.json
-  const walletPath = path.join(homeDir, ".fuego", "wallet.json");
-  if (fs.existsSync(walletPath)) {
-    try {
-      const walletData = JSON.parse(fs.readFileSync(walletPath, "utf8"));
-      if (walletData.address) {
-        return walletData.address;
-      }
-    } catch (e) {
+  try {
+    const walletData = readJsonCached(WALLET_PATH);
+    if (walletData.address) {
+      return walletData.address;
+    }
+  } catch (e) {
+    if (e.code !== "ENOENT") {
       console.warn("⚠️  Could not read wallet.json:", e.message);
     }
   }
@@ -124,6 +150,7 @@ async function buildTransfer(
   toAddr,
   amount,
   token = "USDC",
+  yid = `${YID_PREFIX}-${Date.now()}`,
 ) {
   const endpoint = `${serverUrl}/build-transfer-${token.toLowerCase()}`;
   const payload = {
@@ -131,7 +158,7 @@ async function buildTransfer(
     from_address: fromAddr,
     to_address: toAddr,
     amount,
-    yid: `agent-${process.pid}-${Date.now()}`,
+    yid,
   };
 
   const response = await fetch(endpoint, {
@@ -153,12 +180,39 @@ async function buildTransfer(
 }
 
 /**
- * Decode server tx (base64), set fee payer signer, sign, return base64 signed tx.
+ * Decode server tx (base64), sign it with the wallet signer, return base64 signed tx.
  */
 async function signTransaction(txBase64, signer) {
-  const transactionBytes = new Uint8Array(Buffer.from(txBase64, "base64"));
+  const {
+    decompileTransactionMessage,
+    getBase64EncodedWireTransaction,
+    getCompiledTransactionMessageDecoder,
+    getTransactionDecoder,
+    setTransactionMessageFeePayerSigner,
+    signTransactionMessageWithSigners,
+  } = await loadKit();
+
+  // Native base64 decode; view the Buffer's memory instead of copying it
+  const decoded = Buffer.from(txBase64, "base64");
+  const transactionBytes = new Uint8Array(
+    decoded.buffer,
+    decoded.byteOffset,
+    decoded.byteLength,
+  );
 
   const transaction = getTransactionDecoder().decode(transactionBytes);
+
+  // Fast path: the server already made our address the fee payer, so the message is final.
+  // Sign its bytes as-is and fill our signature slot; no decompile/recompile round-trip.
+  if (signer.address in transaction.signatures) {
+    const [signatures] = await signer.signTransactions([transaction]);
+    return getBase64EncodedWireTransaction({
+      ...transaction,
+      signatures: { ...transaction.signatures, ...signatures },
+    });
+  }
+
+  // Fallback: rebuild the message with our signer as fee payer, then sign
   const compiledMessage = getCompiledTransactionMessageDecoder().decode(
     transaction.messageBytes,
   );
@@ -197,6 +251,131 @@ async function submitTransaction(serverUrl, network, signedTxBase64) {
   return result.data;
 }
 
+/**
+ * Build → sign → submit many transfers with a bounded pool of workers.
+ * Each worker pipelines its own transfer, so builds and submits of different transfers overlap.
+ * @returns {Promise<Array<{to: string, amount: string, token: string, signature?: string, error?: string}>>}
+ */
+async function runBatch(serverUrl, network, fromAddr, signer, transfers) {
+  const batchId = `${YID_PREFIX}-${Date.now()}`;
+  const results = new Array(transfers.length);
+  let next = 0;
+
+  async function worker() {
+    while (next < transfers.length) {
+      const index = next++;
+      const { to, amount, token } = transfers[index];
+      try {
+        const buildResult = await buildTransfer(
+          serverUrl,
+          network,
+          fromAddr,
+          to,
+          amount,
+          token,
+          `${batchId}-${index}`,
+        );
+        const signedTxBase64 = await signTransaction(
+          buildResult.transaction,
+          signer,
+        );
+        const submitResult = await submitTransaction(
+          serverUrl,
+          network,
+          signedTxBase64,
+        );
+        results[index] = {
+          to,
+          amount,
+          token,
+          signature: submitResult.signature,
+        };
+      } catch (e) {
+        results[index] = { to, amount, token, error: e.message };
+      }
+    }
+  }
+
+  const workers = Math.min(BATCH_CONCURRENCY, transfers.length);
+  await Promise.all(Array.from({ length: workers }, worker));
+  return results;
+}
+
+/**
+ * Read and validate a batch file (JSON array of { to, amount, token? }).
+ */
+function loadBatchFile(batchPath) {
+  const entries = JSON.parse(fs.readFileSync(batchPath, "utf8"));
+  if (!Array.isArray(entries) || entries.length === 0) {
+    throw new Error("Batch file must be a non-empty JSON array");
+  }
+  return entries.map((entry, i) => {
+    const token = (entry.token || "USDC").toUpperCase();
+    if (!entry.to || !entry.amount) {
+      throw new Error(`Entry ${i}: "to" and "amount" are required`);
+    }
+    if (!TOKENS.includes(token)) {
+      throw new Error(`Entry ${i}: token must be USDC, SOL, or USDT`);
+    }
+    return { to: entry.to, amount: String(entry.amount), token };
+  });
+}
+
+async function mainBatch(args, network, serverUrl, walletPath) {
+  let transfers;
+  try {
+    transfers = loadBatchFile(args.batch);
+  } catch (e) {
+    console.error("❌ Failed to read batch file:", e.message);
+    process.exit(1);
+  }
+
+  let fromAddr;
+  let signer;
+  try {
+    fromAddr = getWalletAddress();
+    signer = await loadWalletFromFile(walletPath);
+  } catch (e) {
+    console.error("❌ Failed to load wallet:", e.message);
+    process.exit(1);
+  }
+
+  console.log(
+    [
+      "🔥 Fuego Agent Transaction Signer (Node / @solana/kit) - batch",
+      `Network:   ${network}`,
+      `From:      ${fromAddr}`,
+      `Transfers: ${transfers.length}`,
+      "",
+    ].join("\n"),
+  );
+
+  const results = await runBatch(
+    serverUrl,
+    network,
+    fromAddr,
+    signer,
+    transfers,
+  );
+
+  // One write per stream instead of one per transfer
+  const okLines = [];
+  const errorLines = [];
+  results.forEach((r, i) => {
+    if (r.signature) {
+      okLines.push(`✅ [${i}] ${r.amount} ${r.token} → ${r.to}  ${r.signature}`);
+    } else {
+      errorLines.push(`❌ [${i}] ${r.amount} ${r.token} → ${r.to}  ${r.error}`);
+    }
+  });
+  if (okLines.length) console.log(okLines.join("\n"));
+  if (errorLines.length) console.error(errorLines.join("\n"));
+  console.log(
+    `\n${okLines.length}/${results.length} transfers submitted`,
+  );
+  if (errorLines.length) process.exit(1);
+}
+
 async function main() {
   const args = parseArgs();
   const toAddr = args.to;
@@ -205,18 +384,25 @@ async function main() {
   const network = args.network || process.env.FUEGO_NETWORK || "mainnet-beta";
   const serverUrl =
     args.server || process.env.FUEGO_SERVER || "http://127.0.0.1:8080";
-  const walletPath = "~/.fuego/wallet.json";
+  const walletPath = WALLET_PATH;
+
+  if (args.batch) {
+    return mainBatch(args, network, serverUrl, walletPath);
+  }
 
   if (!toAddr || !amount) {
     console.error(
-      "Usage: node fuego_transfer.mjs --to <ADDRESS> --amount <AMOUNT> [--token USDC|SOL|USDT] [--network] [--server]",
+      "Usage: node fuego_transfer.mjs --to <ADDRESS> --amount <AMOUNT> [--token USDC|SOL|USDT] [--network] [--server] [--verbose]",
+    );
+    console.error(
+      "       node fuego_transfer.mjs --batch transfers.json [--network] [--server]",
     );
     console.error(
       "       For SOL transfers, pass --token SOL (default is USDC).",
     );
     process.exit(1);
   }
-  if (!["USDC", "SOL", "USDT"].includes(token)) {
+  if (!TOKENS.includes(token)) {
     console.error("--token must be USDC, SOL, or USDT");
     process.exit(1);
   }
@@ -230,15 +416,17 @@ async function main() {
     process.exit(1);
   }
 
-  console.log("🔥 Fuego Agent Transaction Signer (Node / @solana/kit)");
-  console.log(`Network: ${network}`);
   console.log(
-    `Token:   ${token} (endpoint: build-transfer-${token.toLowerCase()})`,
+    [
+      "🔥 Fuego Agent Transaction Signer (Node / @solana/kit)",
+      `Network: ${network}`,
+      `Token:   ${token} (endpoint: build-transfer-${token.toLowerCase()})`,
+      `From: ${fromAddr}`,
+      `To: ${toAddr}`,
+      `Amount: ${amount} ${token}`,
+      "",
+    ].join("\n"),
   );
-  console.log(`From: ${fromAddr}`);
-  console.log(`To: ${toAddr}`);
-  console.log(`Amount: ${amount} ${token}`);
-  console.log("");
 
   let signer;
   try {
@@ -291,12 +479,16 @@ async function main() {
       submitResult.explorer_link ||
       `https://explorer.solana.com/tx/${sig}?cluster=${network}`;
 
-    console.log("=".repeat(70));
-    console.log(`Signature: ${sig}`);
-    console.log(`Explorer:  ${link}`);
-    console.log("=".repeat(70));
-    console.log("");
-    console.log("🎉 Transaction on-chain!");
+    console.log(
+      [
+        "=".repeat(70),
+        `Signature: ${sig}`,
+        `Explorer:  ${link}`,
+        "=".repeat(70),
+        "",
+        "🎉 Transaction on-chain!",
+      ].join("\n"),
+    );
   } catch (e) {
     if (e.cause?.code === "ECONNREFUSED" || e.message?.includes("fetch")) {
       console.error(`❌ Failed to connect to Fuego server at ${serverUrl}`);
@@ -309,6 +501,7 @@ async function main() {
         console.error("   Context:", JSON.stringify(e.context, null, 2));
       if (e.cause) console.error("   Cause:", e.cause.message || e.cause);
     }
+    if ("verbose" in args && e.stack) console.error(e.stack);
     process.exit(1);
   }
 }
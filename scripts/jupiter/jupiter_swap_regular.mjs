@@ -15,12 +15,19 @@
 import { readFileSync } from 'fs';
 import { homedir } from 'os';
 import { join } from 'path';
-import nacl from 'tweetnacl';
 
 const CONFIG_PATH = join(homedir(), '.fuego', 'config.json');
 const WALLET_INFO_PATH = join(homedir(), '.fuego', 'wallet-config.json');
 const WALLET_PATH = join(homedir(), '.fuego', 'wallet.json');
 
+// tweetnacl is only needed to sign; --help and argument errors exit without loading it
+let naclPromise = null;
+
+function loadNacl() {
+  if (!naclPromise) naclPromise = import('tweetnacl').then(m => m.default);
+  return naclPromise;
+}
+
 // Regular Jupiter API endpoints
 const JUPITER_QUOTE_URL = 'https://api.jup.ag/swap/v1/quote';
 const JUPITER_SWAP_URL = 'https://api.jup.ag/swap/v1/swap';
@@ -178,8 +185,11 @@ function fromBaseUnits(baseUnits, decimals) {
   return `${whole}.${trimmedFraction}`;
 }
 
+// --verbose is a bare flag, so strip it before the flag/value pairing below
+const VERBOSE = process.argv.includes('--verbose');
+
 function parseArgs() {
-  const args = process.argv.slice(2);
+  const args = process.argv.slice(2).filter(arg => arg !== '--verbose');
   
   // Show help if no args
   if (args.length === 0 || args.includes('--help') || args.includes('-h')) {
@@ -194,6 +204,7 @@ Parameters:
   --output   Output token symbol (SOL, USDC, BONK) or full mint address
   --amount   Amount to swap (in token units, e.g., 0.5 for 0.5 SOL)
   --slippage Slippage tolerance in percent (default: 0.5%)
+  --verbose  Print stack traces on failure
 
 Examples:
   node jupiter_swap_regular.mjs --input SOL --output BONK --amount 0.05
@@ -342,6 +353,7 @@ async function fetchSwapTransaction(apiKey, quoteResponse, userPublicKey) {
 async function signTransaction(base64Tx, privateKeyBytes) {
   console.log('\n🔑 Step 3: Signing transaction...');
   
+  const nacl = await loadNacl();
   const keypair = nacl.sign.keyPair.fromSeed(privateKeyBytes);
   console.log('✓ Keypair created');
   
@@ -365,7 +377,7 @@ async function signTransaction(base64Tx, privateKeyBytes) {
   }
   
   // Otherwise sign normally
-  const messageBytes = new Uint8Array(txBytes.slice(65));
+  const messageBytes = txBytes.subarray(65);
   console.log(`✓ Message bytes: ${messageBytes.length}`);
   
   const signature = nacl.sign.detached(messageBytes, keypair.secretKey);
@@ -376,7 +388,7 @@ async function signTransaction(base64Tx, privateKeyBytes) {
   signedTx.set(signature, 1);
   signedTx.set(messageBytes, 65);
   
-  const signedBase64 = Buffer.from(signedTx).toString('base64');
+  const signedBase64 = Buffer.from(signedTx.buffer).toString('base64');
   console.log(`✓ Signed transaction: ${signedBase64.length} chars`);
   
   return signedBase64;
@@ -417,10 +429,11 @@ async function submitTransaction(rpcUrl, signedBase64Tx) {
 async function main() {
   console.log('🪐 Jupiter Regular Swap (NOT Ultra)\n');
   
+  // Parse first so --help and usage errors never touch ~/.fuego
+  const params = parseArgs();
   const config = loadConfig();
   const walletAddress = loadWalletAddress();
   const privateKey = loadWalletPrivateKey();
-  const params = parseArgs();
   
   console.log(`📊 Initial Parameters:`);
   console.log(`   Wallet: ${walletAddress}`);
@@ -440,6 +453,9 @@ async function main() {
   console.log(`✓ Human readable: ${fromBaseUnits(params.amount, inputDecimals)}\n`);
   
   try {
+    // Load the signer library while the quote and swap requests are in flight
+    loadNacl().catch(() => {});
+
     // Step 1: Get quote
     const quote = await fetchQuote(config.jupiterKey, params);
     
@@ -474,7 +490,7 @@ async function main() {
     
   } catch (err) {
     console.error('\n❌ Swap failed:', err.message);
-    if (err.stack) {
+    if (VERBOSE && err.stack) {
       console.error('\nStack:', err.stack);
     }
     process.exit(1);
@@ -5,7 +5,16 @@
  * Usage:
  *   node x402_purch.mjs --product-url <url> --email <email> --name <name> \
  *     --address-line1 <line1> [--address-line2 <line2>] --city <city> \
- *     --state <state> --postal-code <code> [--country <US>] [--url <purch-endpoint>] [--network <mainnet-beta>]
+ *     --state <state> --postal-code <code> [--country <US>] [--url <purch-endpoint>] [--network <mainnet-beta>] [--verbose]
+ *   node x402_purch.mjs --orders orders.json [--rate <orders/sec>] [--burst <n>] [any of the flags above as defaults]
+ *
+ * Orders file: JSON array of order objects keyed like the flags in snake_case
+ * ({ "product_url": ..., "email": ..., "address_line1": ... }). Flags given on the command line
+ * fill in fields an entry leaves out. Up to 8 orders are in flight at once and share one wallet.
+ * --rate caps how fast order requests go out (token bucket, --burst defaults to 1) so bulk runs
+ * stay under Purch's rate limit instead of burning requests on 429s.
+ *
+ * --verbose prints the raw order response and signing details.
  *
  * Example:
  *   node x402_purch.mjs \
@@ -22,14 +31,83 @@
 
 import fs from 'fs';
 import os from 'os';
-import { Connection, Keypair, Transaction, VersionedTransaction } from '@solana/web3.js';
-import bs58 from 'bs58';
 
 const RUST_SERVER_URL = process.env.FUEGO_SERVER_URL || "http://127.0.0.1:8080";
 const PURCH_ORDERS_URL = "https://x402.purch.xyz/orders/solana";
+const WALLET_PATH = `${os.homedir()}/.fuego/wallet.json`;
+const ORDER_CONCURRENCY = 8;
+// snake_case order fields copied verbatim into the /x402-purch payload when set
+const PAYLOAD_FIELDS = [
+  "url",
+  "product_url",
+  "email",
+  "name",
+  "address_line1",
+  "address_line2",
+  "city",
+  "state",
+  "postal_code",
+  "country",
+  "network",
+  "payer_address",
+];
+const ORDER_DEFAULTS = Object.freeze({ url: PURCH_ORDERS_URL, country: "US" });
+const REQUIRED_FIELDS = [
+  "product_url",
+  "email",
+  "name",
+  "address_line1",
+  "city",
+  "state",
+  "postal_code",
+];
+
+/**
+ * An expected failure (bad arguments, missing wallet, rejected order or payment).
+ * Helpers throw it instead of exiting; main's handler turns it into the process exit status.
+ */
+class PurchError extends Error {
+  constructor(message) {
+    super(message);
+    this.name = "PurchError";
+  }
+}
+
+// Solana libraries are imported on first use, so argument errors exit without loading them
+let web3Promise = null;
+let bs58Promise = null;
+
+function loadWeb3() {
+  if (!web3Promise) web3Promise = import('@solana/web3.js');
+  return web3Promise;
+}
+
+function loadBs58() {
+  if (!bs58Promise) bs58Promise = import('bs58').then((m) => m.default);
+  return bs58Promise;
+}
+
+/**
+ * Start the wallet load in the background and resolve once web3.js and bs58 are imported.
+ * Awaited before any order is sent, so a missing dependency fails before Purch creates an order;
+ * wallet errors surface when processOrder awaits loadWallet().
+ */
+async function prepareSigner() {
+  loadWallet();
+  await Promise.all([loadWeb3(), loadBs58()]);
+}
+
+// Set from --verbose in main. debug() takes a thunk so its message is only built when it will be printed.
+let verbose = false;
 
-function parseArgs() {
-  const args = process.argv.slice(2);
+function debug(message) {
+  if (verbose) console.log(message());
+}
+
+/**
+ * Parse CLI flags once into a frozen snake_case map; argv is a parameter so the parse is pure.
+ */
+function parseArgs(args = process.argv.slice(2)) {
   const parsed = {};
   for (let i = 0; i < args.length; i++) {
     const arg = args[i];
@@ -41,19 +119,105 @@ function parseArgs() {
       if (value) i++;
     }
   }
-  return parsed;
+  return Object.freeze(parsed);
 }
 
+const NO_WALLET_MESSAGE = "Failed to load wallet from ~/.fuego/wallet.json\n   Run 'fuego create' first.";
+
+// Keypair is parsed once per process; every signing step reuses it.
+let walletPromise = null;
+
+/**
+ * Read and parse ~/.fuego/wallet.json. Only a missing or unparsable file means there is no usable
+ * wallet; other I/O errors are passed through as-is.
+ */
+async function readWalletFile() {
+  let content;
+  try {
+    content = await fs.promises.readFile(WALLET_PATH, 'utf8');
+  } catch (e) {
+    if (e.code === 'ENOENT') throw new PurchError(NO_WALLET_MESSAGE);
+    throw e;
+  }
+  try {
+    return JSON.parse(content);
+  } catch {
+    throw new PurchError(NO_WALLET_MESSAGE);
+  }
+}
+
+/**
+ * Start loading the wallet keypair (async) and return the cached promise.
+ * Called before the order request so the file read and keypair setup overlap the network round-trip.
+ * Import failures are not mapped to wallet errors; they propagate unchanged.
+ */
 function loadWallet() {
-  const walletPath = `${os.homedir()}/.fuego/wallet.json`;
+  if (!walletPromise) {
+    walletPromise = Promise.all([readWalletFile(), loadWeb3()]).then(([wallet, { Keypair }]) => {
+      const keypair = Keypair.fromSecretKey(new Uint8Array(wallet.privateKey || wallet.private_key));
+      // Report the address of the key that actually signs, not the (possibly stale) stored one
+      return { keypair, address: keypair.publicKey.toBase58() };
+    });
+    // Failures are reported when the keypair is awaited, not while the order is in flight
+    walletPromise.catch(() => {});
+  }
+  return walletPromise;
+}
+
+/**
+ * Normalize a Purch order response into one fixed shape. Purch returns the fields either
+ * at the top level or nested under `order`; resolve each once here instead of at every use.
+ */
+function parseOrderResponse(data) {
+  const order = data?.order;
+  return Object.freeze({
+    orderId: data?.orderId || order?.orderId,
+    paymentStatus: data?.paymentStatus || order?.payment?.status,
+    amount: data?.quote?.totalPrice?.amount || order?.quote?.totalPrice?.amount,
+    currency: data?.quote?.totalPrice?.currency,
+    serializedTransaction: data?.serializedTransaction || order?.payment?.preparation?.serializedTransaction,
+  });
+}
+
+/**
+ * Sign an x402 transaction (base58) with the cached wallet keypair and return it base64-encoded for submission.
+ */
+async function signTransaction(serializedTx, keypair) {
+  const [{ VersionedTransaction }, bs58] = await Promise.all([loadWeb3(), loadBs58()]);
+
+  // x402 transactions are base58 encoded
+  let txBuffer;
   try {
-    const content = fs.readFileSync(walletPath, 'utf8');
-    const wallet = JSON.parse(content);
-    return Keypair.fromSecretKey(new Uint8Array(wallet.privateKey || wallet.private_key));
+    txBuffer = bs58.decode(serializedTx);
   } catch (e) {
-    console.error("❌ Failed to load wallet from ~/.fuego/wallet.json");
-    console.error("   Run 'fuego create' first.");
-    process.exit(1);
+    throw new PurchError(`Failed to sign transaction: ${e.message}`);
+  }
+  debug(() => `   Decoded ${txBuffer.length} bytes`);
+
+  try {
+    // VersionedTransaction parses legacy messages too, and sign() only fills our signer's slot,
+    // so other required signatures (e.g. a facilitator fee payer) are left for them to add
+    const versionedTx = VersionedTransaction.deserialize(txBuffer);
+    versionedTx.sign([keypair]);
+    debug(() => `   Signed ${versionedTx.version === 'legacy' ? 'legacy' : 'v0'} message as VersionedTransaction`);
+    // Wrap the serialized bytes without copying before the native base64 encode
+    const signedBytes = versionedTx.serialize();
+    return Buffer.from(signedBytes.buffer, signedBytes.byteOffset, signedBytes.byteLength).toString('base64');
+  } catch (e) {
+    throw new PurchError(`Failed to sign transaction: ${e.message}`);
+  }
+}
+
+/**
+ * Read a response body once and parse it as JSON. A body that is not JSON (proxy error page,
+ * plain-text 5xx) is reported as-is, reusing the same buffered text.
+ */
+async function readJsonResponse(response) {
+  const text = await response.text();
+  try {
+    return JSON.parse(text);
+  } catch {
+    throw new PurchError(`Non-JSON response (HTTP ${response.status}): ${text || '<empty body>'}`);
   }
 }
 
@@ -68,55 +232,87 @@ async function submitTransaction(serializedTx, network, isVersioned = true) {
       transaction: serializedTx
     }),
   });
-  
-  const result = await response.json();
-  return result;
+
+  return readJsonResponse(response);
 }
 
-async function main() {
-  const args = parseArgs();
+/**
+ * Token bucket: up to `burst` calls pass immediately, then `rate` per second. Callers are served
+ * in order; the returned function resolves when the caller may send.
+ */
+function createRateLimiter(rate, burst) {
+  let tokens = burst;
+  let last = Date.now();
+  let queue = Promise.resolve();
 
-  const required = [
-    "product_url",
-    "email",
-    "name",
-    "address_line1",
-    "city",
-    "state",
-    "postal_code",
-  ];
-  for (const field of required) {
-    if (!args[field]) {
-      console.error(
-        `Missing required argument: --${field.replace(/_/g, "-")}`,
-      );
-      process.exit(1);
-    }
+  function refill() {
+    const now = Date.now();
+    tokens = Math.min(burst, tokens + ((now - last) / 1000) * rate);
+    last = now;
   }
 
-  const payload = {
-    url: args.url || PURCH_ORDERS_URL,
-    product_url: args.product_url,
-    email: args.email,
-    name: args.name,
-    address_line1: args.address_line1,
-    city: args.city,
-    state: args.state,
-    postal_code: args.postal_code,
-    country: args.country || "US",
+  return function acquire() {
+    queue = queue.then(async () => {
+      refill();
+      if (tokens < 1) {
+        await new Promise((resolve) => setTimeout(resolve, ((1 - tokens) / rate) * 1000));
+        refill();
+      }
+      tokens -= 1;
+    });
+    return queue;
   };
-  if (args.address_line2) payload.address_line2 = args.address_line2;
-  if (args.network) payload.network = args.network;
-  if (args.payer_address) payload.payer_address = args.payer_address;
-  if (args.max_price) payload.maxPrice = parseInt(args.max_price);
+}
+
+/**
+ * Pick the payload fields that are set in a snake_case field map (CLI flags or an --orders entry).
+ */
+function pickPayloadFields(fields) {
+  const picked = {};
+  for (const field of PAYLOAD_FIELDS) {
+    const value = fields[field];
+    // A flag passed with no value ("") counts as unset, so defaults like the Purch URL still apply
+    if (value == null || value === "") continue;
+    // The server expects strings; an orders file may hold numbers (e.g. a postal code)
+    if (typeof value === "object") {
+      throw new PurchError(`${field} must be a string`);
+    }
+    picked[field] = String(value);
+  }
+  const rawMaxPrice = fields.max_price;
+  if (rawMaxPrice != null && String(rawMaxPrice).trim() !== "") {
+    const maxPrice = Number(rawMaxPrice);
+    if (!Number.isInteger(maxPrice) || maxPrice < 0) {
+      throw new PurchError("max_price must be a whole number of cents");
+    }
+    // A 0 is only kept when an orders file gives it as a number; from a flag it leaves the server default
+    if (maxPrice > 0 || typeof rawMaxPrice === "number") picked.maxPrice = maxPrice;
+  }
+  return picked;
+}
 
-  console.log("🛒 x402 Purch - Creating order...");
-  console.log("=".repeat(60));
-  console.log(`   Product: ${payload.product_url}`);
-  console.log(`   Email: ${payload.email}`);
-  console.log("=".repeat(60));
+/**
+ * Build one /x402-purch payload: `fields` layered over `defaults`, then checked for required fields.
+ * `defaults` is a frozen payload fragment built once per run, so bulk orders don't redo the shared part.
+ */
+function toOrderPayload(fields, defaults = ORDER_DEFAULTS) {
+  const payload = { ...defaults, ...pickPayloadFields(fields) };
+  for (const field of REQUIRED_FIELDS) {
+    if (!payload[field]) {
+      throw new PurchError(`Missing required argument: --${field.replace(/_/g, "-")}`);
+    }
+  }
+  return payload;
+}
 
+/**
+ * Create one order, sign its payment transaction with the shared wallet and submit it.
+ * Throws on any failure so a batch can record it and move on; `log` receives progress lines.
+ * `throttle`, if given, is awaited before the order request goes out.
+ */
+async function processOrder(payload, log, throttle) {
   // Step 1: Create order via Fuego server
+  if (throttle) await throttle();
   let response;
   try {
     response = await fetch(`${RUST_SERVER_URL}/x402-purch`, {
@@ -125,82 +321,185 @@ async function main() {
       body: JSON.stringify(payload),
     });
   } catch (e) {
-    console.error("❌ Request failed:", e.message);
-    console.error("   Is the Fuego server running? (e.g. cargo run in server/)");
-    process.exit(1);
+    throw new PurchError(`Request failed: ${e.message}\n   Is the Fuego server running? (e.g. cargo run in server/)`);
   }
 
-  const result = await response.json();
+  const result = await readJsonResponse(response);
 
   if (!result.success) {
-    console.error("\n❌ Order creation failed:");
-    console.error(JSON.stringify(result, null, 2));
-    process.exit(1);
+    throw new PurchError(`Order creation failed:\n${JSON.stringify(result, null, 2)}`);
   }
 
-  console.log("\n✅ Order created!");
-  console.log(`   Order ID: ${result.data?.orderId || result.data?.order?.orderId || 'N/A'}`);
-  console.log(`   Status: ${result.data?.paymentStatus || result.data?.order?.payment?.status || 'N/A'}`);
-  console.log(`   Amount: ${result.data?.quote?.totalPrice?.amount || result.data?.order?.quote?.totalPrice?.amount || 'N/A'} ${result.data?.quote?.totalPrice?.currency?.toUpperCase() || 'USDC'}`);
+  debug(() => `   Raw order response: ${JSON.stringify(result.data, null, 2)}`);
+  const order = parseOrderResponse(result.data);
+  log([
+    "\n✅ Order created!",
+    `   Order ID: ${order.orderId || 'N/A'}`,
+    `   Status: ${order.paymentStatus || 'N/A'}`,
+    `   Amount: ${order.amount || 'N/A'} ${order.currency?.toUpperCase() || 'USDC'}`,
+  ].join("\n"));
 
   // Step 2: Get serialized transaction and sign it
-  const serializedTx = result.data?.serializedTransaction || result.data?.order?.payment?.preparation?.serializedTransaction;
-  
+  const serializedTx = order.serializedTransaction;
+
   if (!serializedTx) {
-    console.error("\n❌ No transaction to sign. Response:");
-    console.error(JSON.stringify(result.data, null, 2));
-    process.exit(1);
+    throw new PurchError(`No transaction to sign. Response:\n${JSON.stringify(result.data, null, 2)}`);
   }
 
-  console.log("\n🔐 Signing transaction...");
-  
+  log("\n🔐 Signing transaction...");
+
   // Load wallet
-  const keypair = loadWallet();
-  console.log(`   Wallet: ${keypair.publicKey.toBase58()}`);
+  const { keypair, address } = await loadWallet();
+  log(`   Wallet: ${address}`);
 
-  // Decode and sign transaction (x402 uses base58, not base64)
-  let signedSerializedTx;
-  try {
-    // x402 transactions are base58 encoded
-    const txBuffer = bs58.decode(serializedTx);
-    console.log(`   Decoded ${txBuffer.length} bytes`);
-    // Try VersionedTransaction first (x402 uses this format)
-    const versionedTx = VersionedTransaction.deserialize(txBuffer);
-    versionedTx.sign([keypair]);
-    signedSerializedTx = Buffer.from(versionedTx.serialize()).toString('base64');
-    console.log("   Signed as VersionedTransaction");
-  } catch (vErr) {
+  const signedSerializedTx = await signTransaction(serializedTx, keypair);
+
+  // Step 3: Submit signed transaction
+  log("\n📡 Submitting payment...");
+
+  const submitResult = await submitTransaction(signedSerializedTx, payload.network, true);
+
+  if (!submitResult.success) {
+    throw new PurchError(`Payment submission failed:\n${submitResult.error || JSON.stringify(submitResult, null, 2)}`);
+  }
+  return {
+    orderId: order.orderId,
+    signature: submitResult.data?.signature,
+    explorerLink: submitResult.data?.explorer_link,
+  };
+}
+
+/**
+ * Read an --orders file and build a payload per entry over the shared CLI defaults.
+ */
+function loadOrdersFile(ordersPath, defaults) {
+  const entries = JSON.parse(fs.readFileSync(ordersPath, "utf8"));
+  if (!Array.isArray(entries) || entries.length === 0) {
+    throw new PurchError("Orders file must be a non-empty JSON array");
+  }
+  return entries.map((entry, i) => {
     try {
-      // Fall back to legacy Transaction with base58
-      const txBuffer = bs58.decode(serializedTx);
-      const transaction = Transaction.from(txBuffer);
-      transaction.sign(keypair);
-      signedSerializedTx = transaction.serialize().toString('base64');
-      console.log("   Signed as legacy Transaction");
+      return toOrderPayload(entry, defaults);
     } catch (e) {
-      console.error("❌ Failed to sign transaction:", e.message);
-      process.exit(1);
+      throw new PurchError(`Order ${i}: ${e.message}`);
+    }
+  });
+}
+
+/**
+ * Run many orders through a bounded pool of workers sharing one wallet and keep-alive pool.
+ * @returns {Promise<Array<{orderId?: string, signature?: string, explorerLink?: string, error?: string}>>}
+ */
+async function runOrders(payloads, throttle) {
+  const results = new Array(payloads.length);
+  let next = 0;
+
+  async function worker() {
+    while (next < payloads.length) {
+      const index = next++;
+      try {
+        results[index] = await processOrder(payloads[index], () => {}, throttle);
+      } catch (e) {
+        results[index] = { error: e.message };
+      }
     }
   }
 
-  // Step 3: Submit signed transaction
-  console.log("\n📡 Submitting payment...");
-  
-  const submitResult = await submitTransaction(signedSerializedTx, payload.network, true);
+  const workers = Math.min(ORDER_CONCURRENCY, payloads.length);
+  await Promise.all(Array.from({ length: workers }, worker));
+  return results;
+}
 
-  if (submitResult.success) {
-    console.log("\n🎉 PAYMENT SUCCESSFUL!");
-    console.log(`   Signature: ${submitResult.data?.signature}`);
-    console.log(`   Explorer: ${submitResult.data?.explorer_link}`);
-    console.log("\n✨ Your order is being processed!");
-  } else {
-    console.error("\n❌ Payment submission failed:");
-    console.error(submitResult.error || JSON.stringify(submitResult, null, 2));
-    process.exit(1);
+async function mainOrders(args) {
+  const { orders: ordersPath, rate, burst } = args;
+  // Shared fields from the command line are picked once; each entry only layers its own on top
+  const defaults = Object.freeze({ ...ORDER_DEFAULTS, ...pickPayloadFields(args) });
+
+  let throttle = null;
+  if (rate !== undefined) {
+    const perSecond = Number(rate);
+    const burstSize = burst === undefined ? 1 : Number(burst);
+    if (!(perSecond > 0) || !Number.isInteger(burstSize) || burstSize < 1) {
+      throw new PurchError("--rate must be a positive number and --burst a positive integer");
+    }
+    throttle = createRateLimiter(perSecond, burstSize);
+  }
+
+  let payloads;
+  try {
+    payloads = loadOrdersFile(ordersPath, defaults);
+  } catch (e) {
+    throw new PurchError(`Failed to read orders file: ${e.message}`);
   }
+
+  console.log([
+    "🛒 x402 Purch - Creating orders...",
+    "=".repeat(60),
+    `   Orders: ${payloads.length}`,
+    ...(throttle ? [`   Rate: ${rate}/s (burst ${burst || 1})`] : []),
+    "=".repeat(60),
+  ].join("\n"));
+
+  // One wallet load serves every order; the Solana libraries must be loaded before any order goes out
+  await prepareSigner();
+
+  const results = await runOrders(payloads, throttle);
+
+  // One write per stream instead of one per order
+  const okLines = [];
+  const errorLines = [];
+  results.forEach((r, i) => {
+    const product = payloads[i].product_url;
+    if (r.signature) {
+      okLines.push(`✅ [${i}] ${r.orderId || 'N/A'} ${product}  ${r.signature}`);
+    } else {
+      errorLines.push(`❌ [${i}] ${product}  ${r.error}`);
+    }
+  });
+  if (okLines.length) console.log(okLines.join("\n"));
+  if (errorLines.length) console.error(errorLines.join("\n"));
+  console.log(`\n${okLines.length}/${results.length} orders paid`);
+  if (errorLines.length) process.exitCode = 1;
+}
+
+async function main() {
+  const args = parseArgs();
+  verbose = "verbose" in args;
+
+  if (args.orders) {
+    return mainOrders(args);
+  }
+
+  const payload = toOrderPayload(args);
+
+  console.log([
+    "🛒 x402 Purch - Creating order...",
+    "=".repeat(60),
+    `   Product: ${payload.product_url}`,
+    `   Email: ${payload.email}`,
+    "=".repeat(60),
+  ].join("\n"));
+
+  // Load the signing libraries before the order exists; the wallet keeps loading while it is in flight
+  await prepareSigner();
+
+  const paid = await processOrder(payload, console.log);
+
+  console.log([
+    "\n🎉 PAYMENT SUCCESSFUL!",
+    `   Signature: ${paid.signature}`,
+    `   Explorer: ${paid.explorerLink}`,
+    "\n✨ Your order is being processed!",
+  ].join("\n"));
 }
 
+// The only place that sets the exit status for a failure; everything above throws
 main().catch((e) => {
-  console.error("Error:", e.message);
-  process.exit(1);
+  if (e instanceof PurchError) {
+    console.error(`❌ ${e.message}`);
+  } else {
+    console.error("Error:", e.message);
+  }
+  if (verbose && e.stack) console.error(e.stack);
+  process.exitCode = 1;
 });
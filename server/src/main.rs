@@ -71,6 +71,7 @@ use axum::{
 };
 use serde::{Deserialize, Serialize};
 use serde_json::json;
+use solana_client::nonblocking::rpc_client::RpcClient as NonblockingRpcClient;
 use solana_client::rpc_client::RpcClient;
 use solana_client::rpc_config::CommitmentConfig;
 use solana_sdk::message::Message;
@@ -86,7 +87,11 @@ use tower_http::cors::{Any, CorsLayer};
 use utils::string_to_pub_key;
 use base64::engine::general_purpose;
 use base64::Engine;
+use std::collections::HashMap;
 use std::fs;
+use std::path::{Path, PathBuf};
+use std::sync::{Arc, Mutex, OnceLock};
+use std::time::{Duration, SystemTime};
 
 // Token mint addresses
 const USDC_MINT: &str = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v";
@@ -158,6 +163,39 @@ struct SubmitTransactionRequest {
     commitment: Option<String>,
 }
 
+/// `{"success": true, "data": ...}` envelope for typed responses (serialized directly, no Value tree)
+#[derive(Serialize)]
+struct ApiSuccess<T: Serialize> {
+    success: bool,
+    data: T,
+}
+
+#[derive(Serialize)]
+struct BuildTransferData {
+    transaction: String, // Base64-encoded unsigned transaction
+    blockhash: String,
+    from: String,
+    to: String,
+    amount: String,
+    yid: String,
+    memo: String,
+    network: String,
+}
+
+#[derive(Serialize)]
+struct SubmitTransactionData {
+    signature: String,
+    explorer_link: String,
+    network: String,
+    status: &'static str,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    transaction_type: Option<&'static str>,
+}
+
+fn success_response<T: Serialize>(data: T) -> Response {
+    Json(ApiSuccess { success: true, data }).into_response()
+}
+
 #[derive(Serialize, Deserialize)]
 struct WalletConfig {
     #[serde(rename = "walletAddress")]
@@ -176,6 +214,13 @@ struct WalletStore {
     network: String,
 }
 
+/// Public fields of wallet.json; serde skips `privateKey` without decoding it
+#[derive(Deserialize)]
+struct WalletPublicInfo {
+    address: String,
+    network: String,
+}
+
 #[derive(Serialize, Deserialize)]
 struct X402PurchRequest {
     /// Purch.xyz order endpoint (e.g. https://x402.purch.xyz/orders/solana) or product URL; server POSTs here with order body
@@ -205,6 +250,37 @@ struct X402PurchRequest {
     max_price: Option<u64>,
 }
 
+/// Order body POSTed to Purch. Borrows from the request, so it is built without copying any field.
+#[derive(Serialize)]
+#[serde(rename_all = "camelCase")]
+struct PurchOrderBody<'a> {
+    email: &'a str,
+    payer_address: &'a str,
+    product_url: &'a str,
+    physical_address: PurchPhysicalAddress<'a>,
+    line_items: [PurchLineItem<'a>; 1],
+}
+
+#[derive(Serialize)]
+#[serde(rename_all = "camelCase")]
+struct PurchPhysicalAddress<'a> {
+    name: &'a str,
+    line1: &'a str,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    line2: Option<&'a str>,
+    city: &'a str,
+    state: &'a str,
+    postal_code: &'a str,
+    country: &'a str,
+}
+
+#[derive(Serialize)]
+#[serde(rename_all = "camelCase")]
+struct PurchLineItem<'a> {
+    product_url: &'a str,
+    max_price: u64,
+}
+
 #[derive(Serialize, Deserialize)]
 struct GetAccountSignatures {
     address: String,
@@ -213,10 +289,174 @@ struct GetAccountSignatures {
     limit: Option<usize>,
 }
 
-// State to hold RPC clients (could be expanded for caching)
+// State to hold RPC clients, reused across requests so connections stay alive
 #[derive(Clone)]
 struct AppState {
     default_network: String,
+    /// Shared HTTP client (keep-alive pool) for raw JSON-RPC calls and x402 Purch requests
+    http_client: reqwest::Client,
+    /// RpcClients keyed by (network, commitment)
+    rpc_clients: Arc<Mutex<HashMap<(String, CommitmentConfig), Arc<RpcClient>>>>,
+    /// Async RpcClients keyed by network (used by the x402 payment clients)
+    nonblocking_rpc_clients: Arc<Mutex<HashMap<String, Arc<NonblockingRpcClient>>>>,
+    /// Address served by /wallet-address, cached until either wallet file changes
+    wallet_address: Arc<Mutex<Option<CachedWalletAddress>>>,
+}
+
+#[derive(Clone)]
+struct WalletAddress {
+    address: String,
+    network: String,
+    source: &'static str,
+}
+
+/// Resolved wallet address plus the (wallet-config.json, wallet.json) mtimes it was read at
+struct CachedWalletAddress {
+    modified: (Option<SystemTime>, Option<SystemTime>),
+    wallet: WalletAddress,
+}
+
+/// Debug logging is opt-in via FUEGO_DEBUG; the env lookup happens once per process.
+fn debug_enabled() -> bool {
+    static DEBUG: OnceLock<bool> = OnceLock::new();
+    *DEBUG.get_or_init(|| std::env::var_os("FUEGO_DEBUG").map_or(false, |v| !v.is_empty() && v != "0"))
+}
+
+/// ~/.fuego/wallet.json, resolved once; the home directory does not change while the server runs.
+fn wallet_path() -> &'static Path {
+    static PATH: OnceLock<PathBuf> = OnceLock::new();
+    PATH.get_or_init(|| fuego_dir().join("wallet.json"))
+}
+
+/// ~/.fuego/wallet-config.json, resolved once.
+fn wallet_config_path() -> &'static Path {
+    static PATH: OnceLock<PathBuf> = OnceLock::new();
+    PATH.get_or_init(|| fuego_dir().join("wallet-config.json"))
+}
+
+fn fuego_dir() -> PathBuf {
+    dirs::home_dir().unwrap_or_else(|| PathBuf::from("/")).join(".fuego")
+}
+
+fn file_modified(path: &Path) -> Option<SystemTime> {
+    fs::metadata(path).and_then(|m| m.modified()).ok()
+}
+
+/// Read the x402 signing keypair and address from ~/.fuego/wallet.json.
+/// Called per purchase and never cached, so the key only lives for that one payment.
+fn load_signing_wallet() -> Result<(solana_sdk::signer::keypair::Keypair, String), String> {
+    let wallet_bytes = fs::read(wallet_path())
+        .map_err(|_| "No wallet found at ~/.fuego/wallet.json. Run 'fuego create' first.".to_string())?;
+    let wallet: WalletStore = serde_json::from_slice(&wallet_bytes)
+        .map_err(|e| format!("Invalid wallet.json: {}", e))?;
+
+    if wallet.private_key.len() < 32 {
+        return Err("Wallet private key must be at least 32 bytes".to_string());
+    }
+    let mut secret_arr = [0u8; 32];
+    secret_arr.copy_from_slice(&wallet.private_key[..32]);
+
+    let keypair = solana_sdk::signer::keypair::Keypair::new_from_array(secret_arr);
+    Ok((keypair, wallet.address))
+}
+
+impl AppState {
+    fn new(default_network: &str) -> Self {
+        AppState {
+            default_network: default_network.to_string(),
+            http_client: reqwest::Client::builder()
+                .pool_max_idle_per_host(16)
+                .tcp_keepalive(Duration::from_secs(60))
+                .connect_timeout(Duration::from_secs(5))
+                .build()
+                .expect("Failed to build HTTP client"),
+            rpc_clients: Arc::new(Mutex::new(HashMap::new())),
+            nonblocking_rpc_clients: Arc::new(Mutex::new(HashMap::new())),
+            wallet_address: Arc::new(Mutex::new(None)),
+        }
+    }
+
+    /// Get the cached async RpcClient for a network, creating it on first use.
+    /// Unknown networks get a one-off client so request input can't grow the cache.
+    fn nonblocking_rpc_client(&self, network: &str) -> Arc<NonblockingRpcClient> {
+        let new_client = || {
+            let rpc_url = format!("https://api.{}.solana.com", network);
+            Arc::new(NonblockingRpcClient::new(rpc_url))
+        };
+        if !is_known_cluster(network) {
+            return new_client();
+        }
+        let mut clients = self.nonblocking_rpc_clients.lock().unwrap();
+        clients
+            .entry(network.to_string())
+            .or_insert_with(new_client)
+            .clone()
+    }
+
+    /// Payment-aware client for one x402 purchase. It is layered on the shared keep-alive pool, so
+    /// the TCP+TLS connection to Purch outlives the request while the keypair does not.
+    fn x402_http_client(
+        &self,
+        keypair: solana_sdk::signer::keypair::Keypair,
+        network: &str,
+    ) -> reqwest_middleware::ClientWithMiddleware {
+        use x402_chain_solana::v1_solana_exact::client::V1SolanaExactClient;
+        use x402_chain_solana::v2_solana_exact::client::V2SolanaExactClient;
+        use x402_reqwest::{ReqwestWithPayments, ReqwestWithPaymentsBuild, X402Client};
+
+        let rpc_arc = self.nonblocking_rpc_client(network);
+        let keypair_arc = Arc::new(keypair);
+
+        // Register both V1 and V2 Solana exact clients so we match whatever Purch.xyz returns (V1 or V2 402 format)
+        let x402_client = X402Client::new()
+            .register(V1SolanaExactClient::new(keypair_arc.clone(), rpc_arc.clone()))
+            .register(V2SolanaExactClient::new(keypair_arc, rpc_arc));
+
+        // Cloning a reqwest::Client shares its connection pool
+        self.http_client.clone().with_payments(x402_client).build()
+    }
+
+    /// Resolve the local wallet address, re-reading the files only when their mtimes change.
+    fn wallet_address(&self) -> Option<WalletAddress> {
+        let (config_path, wallet_path) = (wallet_config_path(), wallet_path());
+        let modified = (file_modified(config_path), file_modified(wallet_path));
+
+        let mut cached = self.wallet_address.lock().unwrap();
+        if let Some(entry) = cached.as_ref() {
+            if entry.modified == modified {
+                return Some(entry.wallet.clone());
+            }
+        }
+
+        let wallet = read_wallet_address(config_path, wallet_path)?;
+        *cached = Some(CachedWalletAddress {
+            modified,
+            wallet: wallet.clone(),
+        });
+        Some(wallet)
+    }
+
+    /// Get the cached RpcClient for a network/commitment, creating it on first use.
+    /// Unknown networks get a one-off client so request input can't grow the cache.
+    fn rpc_client(&self, network: &str, commitment: CommitmentConfig) -> Arc<RpcClient> {
+        let new_client = || {
+            let rpc_url = format!("https://api.{}.solana.com", network);
+            Arc::new(RpcClient::new_with_commitment(rpc_url, commitment))
+        };
+        if !is_known_cluster(network) {
+            return new_client();
+        }
+        let mut clients = self.rpc_clients.lock().unwrap();
+        clients
+            .entry((network.to_string(), commitment))
+            .or_insert_with(new_client)
+            .clone()
+    }
+}
+
+/// Public Solana clusters whose RPC clients are worth keeping for the life of the server.
+fn is_known_cluster(network: &str) -> bool {
+    matches!(network, "mainnet-beta" | "devnet" | "testnet")
 }
 
 fn get_commitment_config(commitment: &Option<String>) -> CommitmentConfig {
@@ -251,11 +491,10 @@ async fn health_check() -> impl IntoResponse {
 }
 
 async fn get_latest_hash(
-    State(_state): State<AppState>,
+    State(state): State<AppState>,
     Json(payload): Json<RpcNetwork>,
 ) -> Response {
-    let rpc_url = format!("https://api.{}.solana.com", payload.network);
-    let rpc = RpcClient::new(rpc_url);
+    let rpc = state.rpc_client(&payload.network, CommitmentConfig::default());
 
     match rpc.get_latest_blockhash() {
         Ok(blockhash) => Json(json!({
@@ -273,11 +512,10 @@ async fn get_latest_hash(
 }
 
 async fn get_sol_balance(
-    State(_state): State<AppState>,
+    State(state): State<AppState>,
     Json(payload): Json<GetBalanceRequest>,
 ) -> Response {
-    let rpc_url = format!("https://api.{}.solana.com", payload.network);
-    let rpc = RpcClient::new_with_commitment(rpc_url, CommitmentConfig::confirmed());
+    let rpc = state.rpc_client(&payload.network, CommitmentConfig::confirmed());
 
     let pubkey = match string_to_pub_key(&payload.address) {
         Ok(pk) => pk,
@@ -319,12 +557,11 @@ async fn get_default_network(State(state): State<AppState>) -> impl IntoResponse
 }
 
 async fn get_usdc_balance(
-    State(_state): State<AppState>,
+    State(state): State<AppState>,
     Json(payload): Json<GetTokenBalanceRequest>,
 ) -> Response {
-    let rpc_url = format!("https://api.{}.solana.com", payload.network);
     let commitment = get_commitment_config(&payload.commitment);
-    let rpc = RpcClient::new_with_commitment(rpc_url, commitment);
+    let rpc = state.rpc_client(&payload.network, commitment);
 
     let pubkey = match string_to_pub_key(&payload.address) {
         Ok(pk) => pk,
@@ -372,12 +609,11 @@ async fn get_usdc_balance(
 }
 
 async fn get_usdt_balance(
-    State(_state): State<AppState>,
+    State(state): State<AppState>,
     Json(payload): Json<GetTokenBalanceRequest>,
 ) -> Response {
-    let rpc_url = format!("https://api.{}.solana.com", payload.network);
     let commitment = get_commitment_config(&payload.commitment);
-    let rpc = RpcClient::new_with_commitment(rpc_url, commitment);
+    let rpc = state.rpc_client(&payload.network, commitment);
 
     let pubkey = match string_to_pub_key(&payload.address) {
         Ok(pk) => pk,
@@ -425,12 +661,11 @@ async fn get_usdt_balance(
 }
 
 async fn build_transfer_usdc(
-    State(_state): State<AppState>,
+    State(state): State<AppState>,
     Json(payload): Json<TransferUsdcRequest>,
 ) -> Response {
     // Fetch fresh blockhash
-    let rpc_url = format!("https://api.{}.solana.com", payload.network);
-    let rpc = RpcClient::new(rpc_url);
+    let rpc = state.rpc_client(&payload.network, CommitmentConfig::default());
 
     let blockhash = match rpc.get_latest_blockhash() {
         Ok(bh) => bh,
@@ -559,31 +794,24 @@ async fn build_transfer_usdc(
         }
     };
 
-    Json(json!({
-        "success": true,
-        "data": {
-            "transaction": serde_json::Value::String(
-                general_purpose::STANDARD.encode(&serialized_tx)
-            ),
-            "blockhash": blockhash.to_string(),
-            "from": payload.from_address,
-            "to": payload.to_address,
-            "amount": payload.amount,
-            "yid": payload.yid,
-            "memo": memo_text,
-            "network": payload.network
-        }
-    }))
-    .into_response()
+    success_response(BuildTransferData {
+        transaction: general_purpose::STANDARD.encode(&serialized_tx),
+        blockhash: blockhash.to_string(),
+        from: payload.from_address,
+        to: payload.to_address,
+        amount: payload.amount,
+        yid: payload.yid,
+        memo: memo_text,
+        network: payload.network,
+    })
 }
 
 async fn build_transfer_sol(
-    State(_state): State<AppState>,
+    State(state): State<AppState>,
     Json(payload): Json<TransferSolRequest>,
 ) -> Response {
     // Fetch fresh blockhash
-    let rpc_url = format!("https://api.{}.solana.com", payload.network);
-    let rpc = RpcClient::new(rpc_url);
+    let rpc = state.rpc_client(&payload.network, CommitmentConfig::default());
 
     let blockhash = match rpc.get_latest_blockhash() {
         Ok(bh) => bh,
@@ -687,31 +915,24 @@ async fn build_transfer_sol(
         }
     };
 
-    Json(json!({
-        "success": true,
-        "data": {
-            "transaction": serde_json::Value::String(
-                general_purpose::STANDARD.encode(&serialized_tx)
-            ),
-            "blockhash": blockhash.to_string(),
-            "from": payload.from_address,
-            "to": payload.to_address,
-            "amount": payload.amount,
-            "yid": payload.yid,
-            "memo": memo_text,
-            "network": payload.network
-        }
-    }))
-    .into_response()
+    success_response(BuildTransferData {
+        transaction: general_purpose::STANDARD.encode(&serialized_tx),
+        blockhash: blockhash.to_string(),
+        from: payload.from_address,
+        to: payload.to_address,
+        amount: payload.amount,
+        yid: payload.yid,
+        memo: memo_text,
+        network: payload.network,
+    })
 }
 
 async fn build_transfer_usdt(
-    State(_state): State<AppState>,
+    State(state): State<AppState>,
     Json(payload): Json<TransferUsdtRequest>,
 ) -> Response {
     // Fetch fresh blockhash
-    let rpc_url = format!("https://api.{}.solana.com", payload.network);
-    let rpc = RpcClient::new(rpc_url);
+    let rpc = state.rpc_client(&payload.network, CommitmentConfig::default());
 
     let blockhash = match rpc.get_latest_blockhash() {
         Ok(bh) => bh,
@@ -813,35 +1034,23 @@ async fn build_transfer_usdt(
         }
     };
 
-    Json(json!({
-        "success": true,
-        "data": {
-            "transaction": serde_json::Value::String(
-                general_purpose::STANDARD.encode(&serialized_tx)
-            ),
-            "blockhash": blockhash.to_string(),
-            "from": payload.from_address,
-            "to": payload.to_address,
-            "amount": payload.amount,
-            "yid": payload.yid,
-            "memo": memo_text,
-            "network": payload.network
-        }
-    }))
-    .into_response()
+    success_response(BuildTransferData {
+        transaction: general_purpose::STANDARD.encode(&serialized_tx),
+        blockhash: blockhash.to_string(),
+        from: payload.from_address,
+        to: payload.to_address,
+        amount: payload.amount,
+        yid: payload.yid,
+        memo: memo_text,
+        network: payload.network,
+    })
 }
 
 // x402 Purch endpoint: call Purch x402 URL with order payload; x402-rs handles 402 → pay → retry; return final response.
 async fn x402_purch(
-    State(_state): State<AppState>,
+    State(state): State<AppState>,
     Json(payload): Json<X402PurchRequest>,
 ) -> Response {
-    use reqwest::Client;
-    use std::sync::Arc;
-    use x402_chain_solana::v1_solana_exact::client::V1SolanaExactClient;
-    use x402_chain_solana::v2_solana_exact::client::V2SolanaExactClient;
-    use x402_reqwest::{ReqwestWithPayments, ReqwestWithPaymentsBuild, X402Client};
-
     let network = if payload.network.is_empty() {
         "mainnet-beta".to_string()
     } else {
@@ -849,91 +1058,41 @@ async fn x402_purch(
     };
 
     // Load keypair from ~/.fuego/wallet.json (required for signing x402 payment)
-    let home_dir = dirs::home_dir().unwrap_or_else(|| std::path::PathBuf::from("/"));
-    let wallet_path = home_dir.join(".fuego").join("wallet.json");
-    let wallet_content = match fs::read_to_string(&wallet_path) {
-        Ok(c) => c,
-        Err(_) => {
-            return Json(json!({
-                "success": false,
-                "error": "No wallet found at ~/.fuego/wallet.json. Run 'fuego create' first."
-            }))
-            .into_response();
-        }
-    };
-    let wallet: WalletStore = match serde_json::from_str(&wallet_content) {
+    let (keypair, wallet_address) = match load_signing_wallet() {
         Ok(w) => w,
         Err(e) => {
             return Json(json!({
                 "success": false,
-                "error": format!("Invalid wallet.json: {}", e)
+                "error": e
             }))
             .into_response();
         }
     };
 
-    if wallet.private_key.len() < 32 {
-        return Json(json!({
-            "success": false,
-            "error": "Wallet private key must be at least 32 bytes"
-        }))
-        .into_response();
-    }
-    let mut secret_arr = [0u8; 32];
-    secret_arr.copy_from_slice(&wallet.private_key[..32]);
-
-    let keypair = solana_sdk::signer::keypair::Keypair::new_from_array(secret_arr);
-
-    let rpc_url = format!("https://api.{}.solana.com", network);
-    let rpc = solana_client::nonblocking::rpc_client::RpcClient::new(rpc_url);
-    let rpc_arc = Arc::new(rpc);
-    let keypair_arc = Arc::new(keypair);
-
-    // Register both V1 and V2 Solana exact clients so we match whatever Purch.xyz returns (V1 or V2 402 format)
-    let x402_client = X402Client::new()
-        .register(V1SolanaExactClient::new(keypair_arc.clone(), rpc_arc.clone()))
-        .register(V2SolanaExactClient::new(keypair_arc, rpc_arc));
+    let http_client = state.x402_http_client(keypair, &network);
 
-    let http_client = match Client::builder().with_payments(x402_client).build() {
-        Ok(c) => c,
-        Err(e) => {
-            return Json(json!({
-                "success": false,
-                "error": format!("Failed to build HTTP client: {}", e)
-            }))
-            .into_response();
-        }
+    let payer_address = payload.payer_address.as_deref().unwrap_or(wallet_address.as_str());
+    // Build order body - Purch requires lineItems with maxPrice AND top-level productUrl
+    let order_body = PurchOrderBody {
+        email: &payload.email,
+        payer_address,
+        product_url: &payload.product_url,
+        physical_address: PurchPhysicalAddress {
+            name: &payload.name,
+            line1: &payload.address_line1,
+            line2: payload.address_line2.as_deref().filter(|line2| !line2.is_empty()),
+            city: &payload.city,
+            state: &payload.state,
+            postal_code: &payload.postal_code,
+            country: if payload.country.is_empty() { "US" } else { payload.country.as_str() },
+        },
+        line_items: [PurchLineItem {
+            product_url: &payload.product_url,
+            max_price: payload.max_price.unwrap_or(10000),
+        }],
     };
 
-    let payer_address = payload.payer_address.as_deref().unwrap_or(wallet.address.as_str());
-    let mut physical_address = serde_json::Map::new();
-    physical_address.insert("name".to_string(), serde_json::Value::String(payload.name.clone()));
-    physical_address.insert("line1".to_string(), serde_json::Value::String(payload.address_line1.clone()));
-    physical_address.insert("city".to_string(), serde_json::Value::String(payload.city.clone()));
-    physical_address.insert("state".to_string(), serde_json::Value::String(payload.state.clone()));
-    physical_address.insert("postalCode".to_string(), serde_json::Value::String(payload.postal_code.clone()));
-    physical_address.insert("country".to_string(), serde_json::Value::String(if payload.country.is_empty() { "US".to_string() } else { payload.country.clone() }));
-    if let Some(ref line2) = payload.address_line2 {
-        if !line2.is_empty() {
-            physical_address.insert("line2".to_string(), serde_json::Value::String(line2.clone()));
-        }
-    }
-
-    // Build order body - Purch requires lineItems with maxPrice AND top-level productUrl
-    let order_body = json!({
-        "email": payload.email,
-        "payerAddress": payer_address,
-        "productUrl": payload.product_url,
-        "physicalAddress": physical_address,
-        "lineItems": [
-            {
-                "productUrl": payload.product_url,
-                "maxPrice": payload.max_price.unwrap_or(10000)
-            }
-        ]
-    });
-    
-    eprintln!("DEBUG: Order body being sent to Purch: {}", serde_json::to_string_pretty(&order_body).unwrap_or_default());
+    // Serialize once; the debug log reuses the same bytes that go on the wire
     let body_bytes = match serde_json::to_vec(&order_body) {
         Ok(b) => b,
         Err(e) => {
@@ -944,6 +1103,9 @@ async fn x402_purch(
             .into_response();
         }
     };
+    if debug_enabled() {
+        eprintln!("DEBUG: Order body being sent to Purch: {}", String::from_utf8_lossy(&body_bytes));
+    }
 
     let response = match http_client
         .post(&payload.url)
@@ -963,7 +1125,7 @@ async fn x402_purch(
     };
 
     let status = response.status();
-    let body: String = match response.text().await {
+    let body = match response.bytes().await {
         Ok(b) => b,
         Err(e) => {
             return Json(json!({
@@ -974,9 +1136,10 @@ async fn x402_purch(
         }
     };
 
-    let body_json: serde_json::Value = match serde_json::from_str(&body) {
+    // Parse the raw body; only non-JSON responses are decoded to text
+    let body_json: serde_json::Value = match serde_json::from_slice(&body) {
         Ok(j) => j,
-        Err(_) => serde_json::Value::String(body),
+        Err(_) => serde_json::Value::String(String::from_utf8_lossy(&body).into_owned()),
     };
 
     let success = status.is_success();
@@ -990,11 +1153,10 @@ async fn x402_purch(
 }
 
 async fn submit_transaction(
-    State(_state): State<AppState>,
+    State(state): State<AppState>,
     Json(payload): Json<SubmitTransactionRequest>,
 ) -> Response {
-    let rpc_url = format!("https://api.{}.solana.com", payload.network);
-    let rpc = RpcClient::new(rpc_url);
+    let rpc = state.rpc_client(&payload.network, CommitmentConfig::default());
 
     // Decode base64 transaction
     let tx_bytes = match general_purpose::STANDARD.decode(&payload.transaction) {
@@ -1028,16 +1190,13 @@ async fn submit_transaction(
                 "https://explorer.solana.com/tx/{}?cluster={}",
                 sig_string, payload.network
             );
-            Json(json!({
-                "success": true,
-                "data": {
-                    "signature": sig_string,
-                    "explorer_link": explorer_link,
-                    "network": payload.network,
-                    "status": "submitted"
-                }
-            }))
-            .into_response()
+            success_response(SubmitTransactionData {
+                signature: sig_string,
+                explorer_link,
+                network: payload.network,
+                status: "submitted",
+                transaction_type: None,
+            })
         },
         Err(e) => Json(json!({
             "success": false,
@@ -1049,11 +1208,10 @@ async fn submit_transaction(
 
 // VersionedTransaction endpoint specifically for Jupiter swaps and other v0 transactions
 async fn submit_versioned_transaction(
-    State(_state): State<AppState>,
+    State(state): State<AppState>,
     Json(payload): Json<SubmitTransactionRequest>,
 ) -> Response {
-    let rpc_url = format!("https://api.{}.solana.com", payload.network);
-    let rpc = RpcClient::new(rpc_url);
+    let rpc = state.rpc_client(&payload.network, CommitmentConfig::default());
 
     // Decode base64 transaction
     let tx_bytes = match general_purpose::STANDARD.decode(&payload.transaction) {
@@ -1087,17 +1245,13 @@ async fn submit_versioned_transaction(
                 "https://explorer.solana.com/tx/{}?cluster={}",
                 sig_string, payload.network
             );
-            Json(json!({
-                "success": true,
-                "data": {
-                    "signature": sig_string,
-                    "explorer_link": explorer_link,
-                    "network": payload.network,
-                    "status": "submitted",
-                    "transaction_type": "VersionedTransaction"
-                }
-            }))
-            .into_response()
+            success_response(SubmitTransactionData {
+                signature: sig_string,
+                explorer_link,
+                network: payload.network,
+                status: "submitted",
+                transaction_type: Some("VersionedTransaction"),
+            })
         },
         Err(e) => Json(json!({
             "success": false,
@@ -1108,10 +1262,10 @@ async fn submit_versioned_transaction(
 }
 
 async fn get_all_transactions(
+    State(state): State<AppState>,
     Json(payload): Json<GetAccountSignatures>,
 ) -> Response {
-    let rpc_url = format!("https://api.{}.solana.com", payload.network);
-    let rpc = RpcClient::new(rpc_url);
+    let rpc = state.rpc_client(&payload.network, CommitmentConfig::default());
 
     let user_pubkey = match string_to_pub_key(&payload.address) {
         Ok(pubkey) => pubkey,
@@ -1168,7 +1322,7 @@ const TOKEN_PROGRAM_ID: &str = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA";
 
 /// Call getTokenAccountsByOwner via raw RPC (jsonParsed) and parse response as JSON.
 /// Avoids solana_account_decoder; uses only reqwest + serde_json.
-async fn fetch_token_accounts_json(rpc_url: &str, wallet_address: &str) -> Result<Vec<serde_json::Value>, String> {
+async fn fetch_token_accounts_json(client: &reqwest::Client, rpc_url: &str, wallet_address: &str) -> Result<Vec<serde_json::Value>, String> {
     let body = serde_json::json!({
         "jsonrpc": "2.0",
         "id": 1,
@@ -1179,7 +1333,6 @@ async fn fetch_token_accounts_json(rpc_url: &str, wallet_address: &str) -> Resul
             { "encoding": "jsonParsed" }
         ]
     });
-    let client = reqwest::Client::new();
     let res = client
         .post(rpc_url)
         .json(&body)
@@ -1212,10 +1365,11 @@ struct TokenAccountInfo {
 }
 
 async fn get_tokens(
+    State(state): State<AppState>,
     Json(payload): Json<GetTokensRequest>,
 ) -> Response {
     let rpc_url = format!("https://api.{}.solana.com", payload.network);
-    let rpc = RpcClient::new(rpc_url.clone());
+    let rpc = state.nonblocking_rpc_client(&payload.network);
 
     let wallet_pubkey = match string_to_pub_key(&payload.address) {
         Ok(pubkey) => pubkey,
@@ -1227,8 +1381,14 @@ async fn get_tokens(
         }
     };
 
-    // Get SOL balance (no account decoder involved)
-    let sol_balance = match rpc.get_balance(&wallet_pubkey) {
+    // SOL balance and token accounts are independent lookups; run both round-trips at once
+    let (sol_balance, token_accounts) = tokio::join!(
+        rpc.get_balance(&wallet_pubkey),
+        fetch_token_accounts_json(&state.http_client, &rpc_url, &payload.address),
+    );
+
+    // SOL balance (no account decoder involved)
+    let sol_balance = match sol_balance {
         Ok(lamports) => lamports,
         Err(e) => {
             return Json(json!({
@@ -1238,8 +1398,8 @@ async fn get_tokens(
         }
     };
 
-    // Get token accounts via raw RPC (jsonParsed) and parse as JSON — no solana_account_decoder
-    let token_accounts = match fetch_token_accounts_json(&rpc_url, &payload.address).await {
+    // Token accounts via raw RPC (jsonParsed) and parsed as JSON — no solana_account_decoder
+    let token_accounts = match token_accounts {
         Ok(accounts) => accounts,
         Err(e) => {
             return Json(json!({
@@ -1310,56 +1470,60 @@ async fn get_tokens(
     })).into_response()
 }
 
-async fn get_wallet_address() -> Response {
-    // Try to load wallet address from ~/.fuego/wallet-config.json
-    let home_dir = dirs::home_dir().unwrap_or_else(|| std::path::PathBuf::from("/"));
-    
-    // Try wallet-config.json first (has walletAddress field)
-    let config_path = home_dir.join(".fuego").join("wallet-config.json");
-    if config_path.exists() {
-        if let Ok(config_content) = fs::read_to_string(&config_path) {
-            if let Ok(config) = serde_json::from_str::<WalletConfig>(&config_content) {
-                return Json(json!({
-                    "success": true,
-                    "data": {
-                        "address": config.wallet_address,
-                        "network": config.network,
-                        "source": "wallet-config"
-                    }
-                })).into_response();
-            }
+/// Read the wallet address, preferring wallet-config.json over the legacy wallet.json.
+fn read_wallet_address(config_path: &Path, wallet_path: &Path) -> Option<WalletAddress> {
+    // Try wallet-config.json first (has walletAddress field); a missing file just fails the read
+    if let Ok(config_bytes) = fs::read(config_path) {
+        if let Ok(config) = serde_json::from_slice::<WalletConfig>(&config_bytes) {
+            return Some(WalletAddress {
+                address: config.wallet_address,
+                network: config.network,
+                source: "wallet-config",
+            });
         }
     }
-    
+
     // Fallback to legacy wallet.json (has address field)
-    let wallet_path = home_dir.join(".fuego").join("wallet.json");
-    if wallet_path.exists() {
-        if let Ok(wallet_content) = fs::read_to_string(&wallet_path) {
-            if let Ok(wallet) = serde_json::from_str::<WalletStore>(&wallet_content) {
-                return Json(json!({
-                    "success": true,
-                    "data": {
-                        "address": wallet.address,
-                        "network": wallet.network,
-                        "source": "wallet"
-                    }
-                })).into_response();
-            }
+    if let Ok(wallet_bytes) = fs::read(wallet_path) {
+        if let Ok(wallet) = serde_json::from_slice::<WalletPublicInfo>(&wallet_bytes) {
+            return Some(WalletAddress {
+                address: wallet.address,
+                network: wallet.network,
+                source: "wallet",
+            });
         }
     }
-    
-    // No wallet found
-    Json(json!({
-        "success": false,
-        "error": "No wallet found. Initialize with: fuego create"
-    })).into_response()
+
+    None
+}
+
+async fn get_wallet_address(State(state): State<AppState>) -> Response {
+    match state.wallet_address() {
+        Some(wallet) => Json(json!({
+            "success": true,
+            "data": {
+                "address": wallet.address,
+                "network": wallet.network,
+                "source": wallet.source
+            }
+        })).into_response(),
+        // No wallet found
+        None => Json(json!({
+            "success": false,
+            "error": "No wallet found. Initialize with: fuego create"
+        })).into_response(),
+    }
 }
 
 #[tokio::main]
 async fn main() {
-    let state = AppState {
-        default_network: "mainnet-beta".to_string(),
-    };
+    let state = AppState::new("mainnet-beta");
+
+    // Warm the per-process caches so the first request doesn't pay for them. A missing wallet
+    // is fine here; handlers report it. The signing keypair is never cached (read per purchase).
+    let _ = state.wallet_address();
+    state.rpc_client(&state.default_network, CommitmentConfig::default());
+    state.nonblocking_rpc_client(&state.default_network);
 
     let cors = CorsLayer::new()
         .allow_methods([Method::GET, Method::POST])